@@ -11,6 +11,22 @@ from datetime import datetime, timedelta
 import os
 import re
 import random
+import functools
+from itertools import cycle
+import importlib.util
+import logging
+
+# Progress chatter goes through the logger; set DAILY_LOGLEVEL=DEBUG to see it
+logger = logging.getLogger("daily_assistant")
+
+def configure_logging():
+    """Set up logging from DAILY_LOGLEVEL (defaults to WARNING)"""
+    level_name = os.environ.get("DAILY_LOGLEVEL", "WARNING").strip().upper()
+    level = getattr(logging, level_name, None)
+    if not isinstance(level, int):
+        print(f"⚠️ Unknown DAILY_LOGLEVEL '{level_name}' - using WARNING")
+        level = logging.WARNING
+    logging.basicConfig(level=level, format="%(message)s")
 
 def install_package(package_name, import_name=None):
     """Install a package using pip if it's not already installed"""
@@ -53,30 +69,107 @@ def check_and_install_dependencies():
     print("✅ All required packages are available!")
     return True
 
-# Check and install dependencies before importing them
-if not check_and_install_dependencies():
-    print("⚠️ Warning: Some dependencies are missing. Continuing anyway...")
+DEPS_STAMP_FILE = os.path.join(os.path.expanduser('~'), '.daily_assistant_deps_ok')
+
+def _python_version_line():
+    """sys.version on a single line, as stored in the stamp file"""
+    return sys.version.replace('\n', ' ')
+
+def dependencies_already_checked():
+    """Check the stamp left by a previous successful dependency check"""
+    try:
+        with open(DEPS_STAMP_FILE, 'r', encoding='utf-8') as f:
+            if f.readline().rstrip('\n') != _python_version_line():
+                return False
+    except OSError:
+        return False
+    
+    # find_spec only locates the modules, it doesn't execute them like __import__
+    return all(importlib.util.find_spec(name) is not None for name in ("win32com", "pyttsx3"))
+
+def write_dependencies_stamp():
+    """Remember that dependencies are installed for this Python interpreter"""
+    from importlib import metadata
+    
+    lines = [_python_version_line()]
+    for package_name in ("pywin32", "pyttsx3"):
+        try:
+            lines.append(f"{package_name}=={metadata.version(package_name)}")
+        except metadata.PackageNotFoundError:
+            lines.append(f"{package_name}==unknown")
+    
+    try:
+        with open(DEPS_STAMP_FILE, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+    except OSError as e:
+        print(f"⚠️ Couldn't save dependency check stamp: {e}")
+
+def generate_outlook_wrappers():
+    """Run makepy for Outlook once so early-bound COM wrappers exist before the first calendar read"""
+    try:
+        from win32com.client import gencache
+        gencache.EnsureDispatch("Outlook.Application")
+        print("✅ Outlook COM wrappers are ready")
+    except Exception as e:
+        print(f"⚠️ Couldn't generate Outlook COM wrappers (late binding will be used): {e}")
+
+# Check and install dependencies before importing them (skipped once a previous run succeeded)
+if not dependencies_already_checked():
+    if check_and_install_dependencies():
+        generate_outlook_wrappers()
+        write_dependencies_stamp()
+    else:
+        print("⚠️ Warning: Some dependencies are missing. Continuing anyway...")
 
-# Now import the packages (they should be available)
-try:
-    import win32com.client
-except ImportError:
-    print("❌ Critical: win32com.client not available. Outlook integration will fail.")
-    win32com = None
+# win32com.client and pyttsx3 are imported lazily, only when Outlook or TTS is actually used
+_WIN32COM = None  # Cached win32com.client module (or False if the import failed) after the first attempt
 
-try:
-    import pyttsx3
-except ImportError:
-    print("❌ Critical: pyttsx3 not available. Text-to-speech will be disabled.")
-    pyttsx3 = None
+def _load_win32com():
+    """Import win32com.client on first use, or return None if it isn't available"""
+    global _WIN32COM
+    if _WIN32COM is None:
+        try:
+            import win32com.client
+            _WIN32COM = win32com.client
+        except ImportError:
+            print("❌ Critical: win32com.client not available. Outlook integration will fail.")
+            _WIN32COM = False
+    return _WIN32COM or None
 
 # Configuration
 INCLUDE_TOMORROW = True  # Set to False to only show today's events
+SKIP_TERMS = ('birthday', 'holiday', 'anniversary')  # Events with these words in the subject are ignored
+
+# Precompiled patterns for TTS text cleanup
+_RE_NONWORD = re.compile(r'[^\w\s]')                # Anything except letters, numbers, spaces
+_RE_MIL = re.compile(r'\b([0-2]\d[0-5]\d)\b')        # 4-digit military times (0000-2359)
+_RE_HHMM = re.compile(r'(\d{1,2}):(\d{2})\s*(AM|PM)')  # 12-hour times like 09:00 AM
+
+# Exchange Online distinguished names: drop the "cn=Recipients/cn=..." tail
+_RE_EXCHANGE_RECIPIENTS = re.compile(r'cn=Recipients/cn=.*', re.S)
+
+# Online meeting detection from the location, checked in priority order
+_MEETING_RE = re.compile(r'teams|zoom|webex|http', re.I)
+_MEETING_TYPES = (
+    ("teams", "Microsoft Teams"),
+    ("zoom", "Zoom"),
+    ("webex", "WebEx"),
+    ("http", "Online Meeting"),
+)
+
+# Translation table for TTS text cleanup: separators become spaces, every other
+# ASCII special character is dropped (same result as _RE_NONWORD on ASCII text)
+_TTS_SEPARATORS = '-_/\\|'
+_CLEAN_TABLE = {ord(c): ' ' for c in _TTS_SEPARATORS}
+_CLEAN_TABLE.update({c: None for c in range(128)
+                     if chr(c) not in _TTS_SEPARATORS and _RE_NONWORD.match(chr(c))})
 
 # Initialize TTS engine
 def init_tts():
     """Initialize and configure TTS engine"""
-    if pyttsx3 is None:
+    try:
+        import pyttsx3
+    except ImportError:
         print("⚠️ pyttsx3 not available - TTS disabled")
         return None
         
@@ -87,10 +180,14 @@ def init_tts():
         engine.setProperty('rate', 150)    # Speed of speech
         engine.setProperty('volume', 0.9)  # Volume level (0.0 to 1.0)
         
-        # Try to use a specific voice (optional)
-        voices = engine.getProperty('voices')
-        if voices and len(voices) > 1:
-            engine.setProperty('voice', voices[1].id)  # Use second voice if available
+        # Use a specific voice only when asked - enumerating SAPI voices is slow
+        voice_index = os.environ.get("DAILY_VOICE")
+        if voice_index:
+            try:
+                voices = engine.getProperty('voices')
+                engine.setProperty('voice', voices[int(voice_index)].id)
+            except (ValueError, IndexError, TypeError):
+                print(f"⚠️ Voice {voice_index} not found - using the default voice")
             
         return engine
     except Exception as e:
@@ -113,50 +210,78 @@ def clean_text_for_tts(text):
     if not text:
         return text
     
-    # Replace common special characters with spaces or remove them
-    text = re.sub(r'[-_/\\|]', ' ', text)  # Replace dashes, underscores, slashes with spaces
-    text = re.sub(r'[^\w\s]', '', text)    # Remove all other special characters except letters, numbers, spaces
-    text = re.sub(r'\s+', ' ', text)       # Replace multiple spaces with single space
-    text = text.strip()                    # Remove leading/trailing spaces
+    # Replace dashes, underscores, slashes with spaces and drop other ASCII specials in one pass
+    text = text.translate(_CLEAN_TABLE)
+    if not text.isascii():
+        text = _RE_NONWORD.sub('', text)   # Remove non-ASCII specials (emoji, fancy quotes, etc.)
+    text = ' '.join(text.split())          # Collapse whitespace and remove leading/trailing spaces
     
     return text
 
+@functools.lru_cache(maxsize=256)  # Meeting times cluster on a few slots (:00, :15, :30)
+def _speak_time(hour, minute):
+    """Turn a 24-hour (hour, minute) into speech-friendly text - just numbers, no symbols"""
+    if hour == 0:
+        return "midnight" if minute == 0 else f"12 {minute:02d} AM"
+    elif hour == 12:
+        return "noon" if minute == 0 else f"12 {minute:02d} PM"
+    elif hour > 12:
+        return str(hour - 12) if minute == 0 else f"{hour - 12} {minute:02d}"
+    else:
+        return str(hour) if minute == 0 else f"{hour} {minute:02d}"
+
 def fix_24h_times_for_tts(text):
     """Fix 24-hour time formats that sound stupid in TTS"""
     if not text:
         return text
     
     # Fix specific patterns like "1200 to 1800" -> "12 to 6"
-    # Only target 4-digit military times that are clearly time formats
-    def convert_24h_time(match):
-        time_str = match.group(0)
-        hour = int(time_str[:2])
-        minute = int(time_str[2:])
-        
-        # Convert to simple hour format for TTS
-        if hour == 0:
-            return "midnight" if minute == 0 else f"12 {minute:02d} AM"
-        elif hour == 12:
-            return "noon" if minute == 0 else f"12 {minute:02d} PM"
-        elif hour > 12:
-            return str(hour - 12) if minute == 0 else f"{hour - 12} {minute:02d}"
-        else:
-            return str(hour) if minute == 0 else f"{hour} {minute:02d}"
-    
     # Only replace 4-digit times that look like military time (0000-2359)
-    # More specific pattern to avoid false matches
-    text = re.sub(r'\b([0-2]\d[0-5]\d)\b', convert_24h_time, text)
+    # Built from slices between matches instead of re.sub with a callback
+    pieces = []
+    last_end = 0
+    for match in _RE_MIL.finditer(text):
+        time_str = match.group(1)
+        pieces.append(text[last_end:match.start()])
+        pieces.append(_speak_time(int(time_str[:2], 10), int(time_str[2:], 10)))
+        last_end = match.end()
+    
+    if not pieces:
+        return text
+    pieces.append(text[last_end:])
     
-    return text
+    return "".join(pieces)
+
+def format_time_for_speech(time_str):
+    """Convert 09:00 AM to 9 for better TTS (no colons or symbols)"""
+    # Extract hour and AM/PM
+    match = _RE_HHMM.match(time_str)
+    if match:
+        hour = int(match.group(1))
+        minute = int(match.group(2))
+        period = match.group(3)
+        
+        # Convert to 24h format first for easier handling
+        if period == 'PM' and hour != 12:
+            hour += 12
+        elif period == 'AM' and hour == 12:
+            hour = 0
+        
+        return _speak_time(hour, minute)
+    return time_str
 
-def get_random_transition():
-    """Get a random transition word for natural speech"""
-    transitions = ["followed by", "then", "next"]
-    return random.choice(transitions)
+TRANSITIONS = ["followed by", "then", "next"]  # Transition words for natural speech
 
-def get_time_greeting():
-    """Get appropriate greeting based on current time"""
-    current_hour = datetime.now().hour
+def shuffle_transitions():
+    """Start a new shuffled cycle of transition words (never the same one twice in a row)"""
+    global _TRANSITIONS
+    _TRANSITIONS = cycle(random.sample(TRANSITIONS, len(TRANSITIONS)))
+
+shuffle_transitions()
+
+def get_time_greeting(now=None):
+    """Get appropriate greeting based on current time (or the given datetime)"""
+    current_hour = (now or datetime.now()).hour
     
     if 5 <= current_hour < 12:
         return "Good morning"
@@ -167,7 +292,16 @@ def get_time_greeting():
     else:
         return "Good night"
 
+_USER_NAME = None  # Cached after the first lookup so user_name.txt is read once per run
+
 def get_user_name():
+    """Get user's name (cached after the first call)"""
+    global _USER_NAME
+    if _USER_NAME is None:
+        _USER_NAME = _load_user_name()
+    return _USER_NAME
+
+def _load_user_name():
     """Get user's name from file or ask for it"""
     name_file = os.path.join(os.path.dirname(__file__), 'user_name.txt')
     
@@ -194,61 +328,79 @@ def get_user_name():
     
     return name
 
-def get_today_calendar_events():
-    """Get today's Outlook calendar events and return as structured data - USING WORKING LOGIC FROM outlook_today.py"""
+@functools.lru_cache(maxsize=1)
+def _get_calendar_folder():
+    """Connect to local Outlook once and return (outlook, namespace, calendar_folder)"""
+    client = _load_win32com()
+    
+    # Early-bound wrapper: the typelib is generated once and property reads skip name lookups
+    try:
+        outlook = client.gencache.EnsureDispatch("Outlook.Application")
+    except Exception as e:
+        print(f"⚠️ Early-bound Outlook dispatch failed ({e}), falling back to late binding")
+        outlook = client.Dispatch("Outlook.Application")
+    namespace = outlook.GetNamespace("MAPI")
+    
+    # Get default calendar folder (constants are only filled in by the early-bound wrapper)
+    calendar_folder = namespace.GetDefaultFolder(getattr(client.constants, 'olFolderCalendar', 9))
+    
+    return outlook, namespace, calendar_folder
+
+def _fetch_events(date_from, date_to):
+    """Get Outlook appointments starting in [date_from, date_to) with one calendar query
+    
+    Returns a dict mapping each date in the range to its (start, subject, appointment)
+    tuples, so callers never read appointment.Start or .Subject from COM again.
+    Every date has an entry, with an empty list if Outlook couldn't be read.
+    """
     
     print("📅 Reading LOCAL Outlook calendar...")
     
-    if win32com is None:
+    events_by_date = {date_from + timedelta(days=i): [] for i in range((date_to - date_from).days)}
+    
+    if _load_win32com() is None:
         print("❌ win32com.client not available - cannot access Outlook")
-        return []
+        return events_by_date
     
     try:
-        # Connect to local Outlook
-        outlook = win32com.client.Dispatch("Outlook.Application")
-        namespace = outlook.GetNamespace("MAPI")
+        # Connect to local Outlook (shared connection)
+        outlook, namespace, calendar_folder = _get_calendar_folder()
         
-        # Get default calendar folder
-        calendar_folder = namespace.GetDefaultFolder(9)  # 9 = olFolderCalendar
+        if logger.isEnabledFor(logging.DEBUG):  # Avoid the COM reads unless they'll be logged
+            logger.debug("📂 Looking in calendar: %s", calendar_folder.Name)
+            logger.debug("📊 Total items in calendar: %s", calendar_folder.Items.Count)
         
-        print(f"📂 Looking in calendar: {calendar_folder.Name}")
-        print(f"📊 Total items in calendar: {calendar_folder.Items.Count}")
-        
-        # Get today's date range
-        today = datetime.now().date()
-        start_time = datetime.combine(today, datetime.min.time())
-        end_time = datetime.combine(today, datetime.max.time())
-        
-        # Get appointments for today
+        # Get appointments for the whole range
         appointments = calendar_folder.Items
         appointments.Sort("[Start]")
         appointments.IncludeRecurrences = True
         
         # Use date restriction instead of looping through everything
-        today_str = today.strftime('%m/%d/%Y')
-        tomorrow_str = (today + timedelta(days=1)).strftime('%m/%d/%Y')
-        restriction = f"[Start] >= '{today_str}' AND [Start] < '{tomorrow_str}'"
+        from_str = date_from.strftime('%m/%d/%Y')
+        to_str = date_to.strftime('%m/%d/%Y')
+        restriction = f"[Start] >= '{from_str}' AND [Start] < '{to_str}'"
         
-        print(f"🔍 Searching for events on {today_str} with filter: {restriction}")
+        logger.debug("🔍 Searching for events from %s to %s with filter: %s", from_str, to_str, restriction)
         
         events = []
         
         try:
             filtered_appointments = appointments.Restrict(restriction)
-            print(f"✅ Found {filtered_appointments.Count} events with filter")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("✅ Found %s events with filter", filtered_appointments.Count)
             
             events = []
             for appointment in filtered_appointments:
+                start = appointment.Start
+                subj = appointment.Subject
                 # Skip birthday and holiday events
-                subject = appointment.Subject.lower()
-                if ('birthday' in subject or 
-                    'holiday' in subject or 
-                    'anniversary' in subject or
-                    appointment.Start.date() != today):  # Only today's events
+                subj_lower = subj.lower()
+                if (any(term in subj_lower for term in SKIP_TERMS) or
+                    not date_from <= start.date() < date_to):  # Only events in range
                     continue
                     
-                events.append(appointment)
-                print(f"   📅 {appointment.Subject} at {appointment.Start}")
+                events.append((start, subj, appointment))
+                logger.debug("   📅 %s at %s", subj, start)
         except Exception as filter_error:
             print(f"⚠️ Filter failed: {filter_error}")
             print("🔄 Trying manual search (limited to last 100 items)...")
@@ -262,33 +414,81 @@ def get_today_calendar_events():
                     print("⏹️ Stopping search at 100 items")
                     break
                 try:
-                    appt_date = appointment.Start.date()
-                    if appt_date == today:
+                    start = appointment.Start
+                    if date_from <= start.date() < date_to:
+                        subj = appointment.Subject
                         # Skip birthday and holiday events
-                        subject = appointment.Subject.lower()
-                        if ('birthday' in subject or 
-                            'holiday' in subject or 
-                            'anniversary' in subject):
+                        subj_lower = subj.lower()
+                        if any(term in subj_lower for term in SKIP_TERMS):
                             continue
                             
-                        events.append(appointment)
-                        print(f"   📅 {appointment.Subject} at {appointment.Start}")
+                        events.append((start, subj, appointment))
+                        logger.debug("   📅 %s at %s", subj, start)
                 except:
                     continue
     
     except Exception as e:
         print(f"❌ Error accessing Outlook: {e}")
         print("Make sure Outlook is installed and you have calendar events!")
-        return []
+        return events_by_date
+    
+    for event in events:
+        events_by_date[event[0].date()].append(event)
     
-    # Now convert the raw appointment objects to structured data
+    return events_by_date
+
+def _get_organizer_name(appointment):
+    """Get the organizer name of an appointment, trying multiple approaches (like we learned from debugging)"""
+    try:
+        organizer = appointment.Organizer
+        return str(organizer) if organizer else ''
+    except:
+        # Try GetOrganizer method if direct access fails
+        try:
+            organizer_obj = appointment.GetOrganizer()
+            if not organizer_obj:
+                return ''
+            try:
+                organizer_name = organizer_obj.Name
+            except AttributeError:
+                return ''
+            # Clean up Exchange Online email addresses
+            if '/o=ExchangeLabs/' in organizer_name:
+                organizer_name = _RE_EXCHANGE_RECIPIENTS.sub('', organizer_name, count=1)
+            return organizer_name
+        except:
+            return ''
+
+_EVENTS_CACHE = {}  # date -> structured events (plain dicts, no COM objects); reloading a range refreshes it
+
+def load_calendar_events(date_from, date_to):
+    """Read every day in [date_from, date_to) with one Outlook query and cache the structured events per date"""
+    events_by_date = _fetch_events(date_from, date_to)
+    for target_date, events in events_by_date.items():
+        _EVENTS_CACHE[target_date] = _build_events_data(events)
+
+def get_calendar_events(target_date):
+    """Get one day's Outlook calendar events as structured data
+    
+    Served from the cache filled by load_calendar_events; a day that wasn't
+    loaded is fetched on its own. Returns copies, so callers may modify them.
+    """
+    if target_date not in _EVENTS_CACHE:
+        load_calendar_events(target_date, target_date + timedelta(days=1))
+    return [dict(event_info) for event_info in _EVENTS_CACHE[target_date]]
+
+def _build_events_data(events):
+    """Convert raw (start, subject, appointment) tuples to structured data - USING WORKING LOGIC FROM outlook_today.py"""
+    
+    # Convert the raw appointment objects to structured data
     events_data = []
-    for appointment in events:
+    for start, subj, appointment in events:
         try:
-            # Basic required fields first
-            subject = str(appointment.Subject) if appointment.Subject else "No Subject"
-            start_time = appointment.Start.strftime('%I:%M %p')
-            end_time = appointment.End.strftime('%I:%M %p')
+            # Basic required fields first (each COM property is read exactly once)
+            end = appointment.End
+            subject = str(subj) if subj else "No Subject"
+            start_time = start.strftime('%I:%M %p')
+            end_time = end.strftime('%I:%M %p')
             
             event_info = {
                 'subject': subject,
@@ -298,27 +498,12 @@ def get_today_calendar_events():
             
             # Optional fields with safe access
             try:
-                event_info['location'] = str(appointment.Location) if appointment.Location else ''
+                loc = appointment.Location
+                event_info['location'] = str(loc) if loc else ''
             except:
                 event_info['location'] = ''
             
-            # Try multiple approaches to get organizer info (like we learned from debugging)
-            organizer_name = ''
-            try:
-                organizer_name = str(appointment.Organizer) if appointment.Organizer else ''
-            except:
-                # Try GetOrganizer method if direct access fails
-                try:
-                    organizer_obj = appointment.GetOrganizer()
-                    if organizer_obj:
-                        organizer_name = getattr(organizer_obj, 'Name', str(organizer_obj))
-                        # Clean up Exchange Online email addresses
-                        if '/o=ExchangeLabs/' in organizer_name:
-                            organizer_name = organizer_name.split('cn=Recipients/cn=')[0] if 'cn=Recipients/cn=' in organizer_name else organizer_name
-                except:
-                    organizer_name = ''
-            
-            event_info['organizer'] = organizer_name
+            event_info['organizer'] = _get_organizer_name(appointment)
             
             try:
                 event_info['is_recurring'] = bool(appointment.IsRecurring)
@@ -331,7 +516,8 @@ def get_today_calendar_events():
                 event_info['all_day'] = False
             
             try:
-                event_info['categories'] = str(appointment.Categories) if appointment.Categories else ''
+                categories = appointment.Categories
+                event_info['categories'] = str(categories) if categories else ''
             except:
                 event_info['categories'] = ''
             
@@ -345,42 +531,37 @@ def get_today_calendar_events():
             except:
                 event_info['reminder_set'] = False
             
-            # Calculate duration
+            # Calculate duration (all-day events always span 24h, so just label them)
             try:
-                duration = appointment.End - appointment.Start
-                hours = duration.seconds // 3600
-                minutes = (duration.seconds % 3600) // 60
-                if hours > 0:
-                    event_info['duration'] = f"{hours}h {minutes}m"
+                if event_info['all_day']:
+                    event_info['duration'] = "All day"
                 else:
-                    event_info['duration'] = f"{minutes}m"
+                    duration = end - start
+                    hours, minutes = divmod(duration.seconds // 60, 60)
+                    if hours > 0:
+                        event_info['duration'] = f"{hours}h {minutes}m"
+                    else:
+                        event_info['duration'] = f"{minutes}m"
             except:
                 event_info['duration'] = "Unknown"
             
             # Check for online meeting
             try:
-                location = str(event_info['location']).lower() if event_info['location'] else ""
-                if "teams" in location:
-                    event_info['meeting_type'] = "Microsoft Teams"
-                    event_info['is_online'] = True
-                elif "zoom" in location:
-                    event_info['meeting_type'] = "Zoom"
-                    event_info['is_online'] = True
-                elif "webex" in location:
-                    event_info['meeting_type'] = "WebEx"
-                    event_info['is_online'] = True
-                elif "http" in location:
-                    event_info['meeting_type'] = "Online Meeting"
-                    event_info['is_online'] = True
-                else:
-                    event_info['is_online'] = False
-                    event_info['meeting_type'] = "In-person"
+                # One scan over the location; keep the original priority (Teams link in an http URL is still Teams)
+                found = {keyword.lower() for keyword in _MEETING_RE.findall(event_info['location'])}
+                event_info['is_online'] = False
+                event_info['meeting_type'] = "In-person"
+                for keyword, meeting_type in _MEETING_TYPES:
+                    if keyword in found:
+                        event_info['meeting_type'] = meeting_type
+                        event_info['is_online'] = True
+                        break
             except:
                 event_info['is_online'] = False
                 event_info['meeting_type'] = "Unknown"
             
             events_data.append(event_info)
-            print(f"✅ Processed: {subject}")
+            logger.debug("✅ Processed: %s", subject)
             
         except Exception as e:
             print(f"⚠️ Skipping problematic event: {e}")
@@ -388,158 +569,25 @@ def get_today_calendar_events():
     
     return events_data
 
-def get_tomorrow_calendar_events():
-    """Get tomorrow's Outlook calendar events and return as structured data"""
+def get_ai_day_analysis(events_summary, events_data, tomorrow_events_data=None, user_name=None, now=None,
+                        tts_enabled=True):
+    """Generate a simple hard-coded summary of the day and optionally tomorrow
     
-    print("📅 Reading tomorrow's calendar events...")
-    
-    if win32com is None:
-        print("❌ win32com.client not available - cannot access Outlook")
-        return []
-    
-    try:
-        # Connect to local Outlook
-        outlook = win32com.client.Dispatch("Outlook.Application")
-        namespace = outlook.GetNamespace("MAPI")
-        
-        # Get default calendar folder
-        calendar_folder = namespace.GetDefaultFolder(9)  # 9 = olFolderCalendar
-        
-        # Get tomorrow's date range
-        tomorrow = datetime.now().date() + timedelta(days=1)
-        day_after_tomorrow = tomorrow + timedelta(days=1)
-        
-        # Get appointments for tomorrow
-        appointments = calendar_folder.Items
-        appointments.Sort("[Start]")
-        appointments.IncludeRecurrences = True
-        
-        # Use date restriction for tomorrow
-        tomorrow_str = tomorrow.strftime('%m/%d/%Y')
-        day_after_str = day_after_tomorrow.strftime('%m/%d/%Y')
-        restriction = f"[Start] >= '{tomorrow_str}' AND [Start] < '{day_after_str}'"
-        
-        print(f"🔍 Searching for events on {tomorrow_str} with filter: {restriction}")
-        
-        events = []
-        
-        try:
-            filtered_appointments = appointments.Restrict(restriction)
-            print(f"✅ Found {filtered_appointments.Count} events for tomorrow")
-            
-            events = []
-            for appointment in filtered_appointments:
-                # Skip birthday and holiday events
-                subject = appointment.Subject.lower()
-                if ('birthday' in subject or 
-                    'holiday' in subject or 
-                    'anniversary' in subject or
-                    appointment.Start.date() != tomorrow):  # Only tomorrow's events
-                    continue
-                    
-                events.append(appointment)
-                print(f"   📅 {appointment.Subject} at {appointment.Start}")
-        except Exception as filter_error:
-            print(f"⚠️ Filter failed for tomorrow: {filter_error}")
-            return []
-    
-    except Exception as e:
-        print(f"❌ Error accessing Outlook for tomorrow: {e}")
-        return []
-    
-    # Convert the raw appointment objects to structured data (same as today)
-    events_data = []
-    for appointment in events:
-        try:
-            # Basic required fields first
-            subject = str(appointment.Subject) if appointment.Subject else "No Subject"
-            start_time = appointment.Start.strftime('%I:%M %p')
-            end_time = appointment.End.strftime('%I:%M %p')
-            
-            event_info = {
-                'subject': subject,
-                'start_time': start_time,
-                'end_time': end_time
-            }
-            
-            # Optional fields with safe access
-            try:
-                event_info['location'] = str(appointment.Location) if appointment.Location else ''
-            except:
-                event_info['location'] = ''
-            
-            # Try multiple approaches to get organizer info
-            organizer_name = ''
-            try:
-                organizer_name = str(appointment.Organizer) if appointment.Organizer else ''
-            except:
-                try:
-                    organizer_obj = appointment.GetOrganizer()
-                    if organizer_obj:
-                        organizer_name = getattr(organizer_obj, 'Name', str(organizer_obj))
-                        if '/o=ExchangeLabs/' in organizer_name:
-                            organizer_name = organizer_name.split('cn=Recipients/cn=')[0] if 'cn=Recipients/cn=' in organizer_name else organizer_name
-                except:
-                    organizer_name = ''
-            
-            event_info['organizer'] = organizer_name
-            
-            events_data.append(event_info)
-            print(f"✅ Processed tomorrow: {subject}")
-            
-        except Exception as e:
-            print(f"⚠️ Skipping problematic tomorrow event: {e}")
-            continue
-    
-    return events_data
-
-def get_ai_day_analysis(events_summary, events_data, tomorrow_events_data=None):
-    """Generate a simple hard-coded summary of the day and optionally tomorrow"""
+    With tts_enabled=False the summary is only printed, so the TTS text cleanup is skipped.
+    """
     
     print("📝 Creating your day summary...")
     
     try:
-        if not events_data and not tomorrow_events_data:
-            greeting = get_time_greeting()
+        if user_name is None:
             user_name = get_user_name()
-            return f"{greeting} {user_name}! You have a free day with no scheduled meetings - perfect time to catch up on personal projects or take a well-deserved break!"
         
-        # Get user's name and time greeting
-        user_name = get_user_name()
-        greeting = get_time_greeting()
+        if not events_data and not tomorrow_events_data:
+            greeting = get_time_greeting(now)
+            return f"{greeting} {user_name}! You have a free day with no scheduled meetings - perfect time to catch up on personal projects or take a well-deserved break!"
         
-        def format_time_for_speech(time_str):
-            """Convert 09:00 AM to 9 for better TTS (no colons or symbols)"""
-            # Extract hour and AM/PM
-            match = re.match(r'(\d{1,2}):(\d{2})\s*(AM|PM)', time_str)
-            if match:
-                hour = int(match.group(1))
-                minute = int(match.group(2))
-                period = match.group(3)
-                
-                # Convert to 24h format first for easier handling
-                if period == 'PM' and hour != 12:
-                    hour += 12
-                elif period == 'AM' and hour == 12:
-                    hour = 0
-                
-                # Format for speech - just numbers, no symbols
-                if minute == 0:
-                    if hour == 0:
-                        return "midnight"
-                    elif hour == 12:
-                        return "noon" 
-                    elif hour > 12:
-                        return f"{hour-12}"
-                    else:
-                        return f"{hour}"
-                else:
-                    # For non-zero minutes, just say the numbers
-                    if hour > 12:
-                        return f"{hour-12} {minute:02d}"
-                    else:
-                        return f"{hour} {minute:02d}"
-            return time_str
+        # Get time greeting
+        greeting = get_time_greeting(now)
         
         def create_meeting_summary(events, day_name="today"):
             """Create meeting summary for a given day"""
@@ -547,14 +595,21 @@ def get_ai_day_analysis(events_summary, events_data, tomorrow_events_data=None):
             for event in events:
                 organizer = event['organizer'] if event['organizer'] else "Unknown organizer"
                 
-                # Clean the subject for TTS
-                clean_subject = clean_text_for_tts(event['subject'])
-                clean_subject = fix_24h_times_for_tts(clean_subject)
-                clean_organizer = clean_text_for_tts(organizer)
-                
-                # Format times for natural speech
-                start_time = format_time_for_speech(event['start_time'])
-                end_time = format_time_for_speech(event['end_time'])
+                if tts_enabled:
+                    # Clean the subject for TTS
+                    clean_subject = clean_text_for_tts(event['subject'])
+                    clean_subject = fix_24h_times_for_tts(clean_subject)
+                    clean_organizer = clean_text_for_tts(organizer)
+                    
+                    # Format times for natural speech
+                    start_time = format_time_for_speech(event['start_time'])
+                    end_time = format_time_for_speech(event['end_time'])
+                else:
+                    # Text is only displayed, keep it as it appears in Outlook
+                    clean_subject = event['subject']
+                    clean_organizer = organizer
+                    start_time = event['start_time']
+                    end_time = event['end_time']
                 time_range = f"{start_time} to {end_time}"
                 
                 # Check if the user is the organizer (meeting organized by them)
@@ -565,29 +620,29 @@ def get_ai_day_analysis(events_summary, events_data, tomorrow_events_data=None):
             
             return meeting_parts
         
-        # Create today's summary
-        result = ""
+        # Create today's summary (fragments are joined once at the end)
+        parts = []
         if events_data:
             meeting_parts = create_meeting_summary(events_data, "today")
             
             if len(meeting_parts) == 1:
-                result = f"{greeting} {user_name}! You start your day with {meeting_parts[0]}."
+                parts.append(f"{greeting} {user_name}! You start your day with {meeting_parts[0]}.")
             elif len(meeting_parts) == 2:
-                transition = get_random_transition()
-                result = f"{greeting} {user_name}! You start your day with {meeting_parts[0]}, {transition} {meeting_parts[1]}."
+                transition = next(_TRANSITIONS)
+                parts.append(f"{greeting} {user_name}! You start your day with {meeting_parts[0]}, {transition} {meeting_parts[1]}.")
             else:
                 # For 3+ meetings, use random transitions between each meeting
-                result = f"{greeting} {user_name}! You start your day with {meeting_parts[0]}"
+                parts.append(f"{greeting} {user_name}! You start your day with {meeting_parts[0]}")
                 
                 # Add middle meetings with random transitions
                 for i in range(1, len(meeting_parts) - 1):
-                    transition = get_random_transition()
-                    result += f", {transition} {meeting_parts[i]}"
+                    transition = next(_TRANSITIONS)
+                    parts.append(f", {transition} {meeting_parts[i]}")
                 
                 # Add the final meeting
-                result += f", and finally {meeting_parts[-1]}."
+                parts.append(f", and finally {meeting_parts[-1]}.")
         else:
-            result = f"{greeting} {user_name}! You have a free day today."
+            parts.append(f"{greeting} {user_name}! You have a free day today.")
         
         # Add tomorrow's summary if available
         if tomorrow_events_data:
@@ -595,28 +650,30 @@ def get_ai_day_analysis(events_summary, events_data, tomorrow_events_data=None):
             
             if tomorrow_parts:
                 if len(tomorrow_parts) == 1:
-                    result += f" Tomorrow you have {tomorrow_parts[0]}."
+                    parts.append(f" Tomorrow you have {tomorrow_parts[0]}.")
                 elif len(tomorrow_parts) == 2:
-                    transition = get_random_transition()
-                    result += f" Tomorrow you start with {tomorrow_parts[0]}, {transition} {tomorrow_parts[1]}."
+                    transition = next(_TRANSITIONS)
+                    parts.append(f" Tomorrow you start with {tomorrow_parts[0]}, {transition} {tomorrow_parts[1]}.")
                 else:
-                    result += f" Tomorrow you start with {tomorrow_parts[0]}"
+                    parts.append(f" Tomorrow you start with {tomorrow_parts[0]}")
                     for i in range(1, len(tomorrow_parts) - 1):
-                        transition = get_random_transition()
-                        result += f", {transition} {tomorrow_parts[i]}"
-                    result += f", and finally {tomorrow_parts[-1]}."
+                        transition = next(_TRANSITIONS)
+                        parts.append(f", {transition} {tomorrow_parts[i]}")
+                    parts.append(f", and finally {tomorrow_parts[-1]}.")
             else:
-                result += " Tomorrow is free with no scheduled meetings."
+                parts.append(" Tomorrow is free with no scheduled meetings.")
         
+        result = "".join(parts)
         return result
         
     except Exception as e:
         return f"Sorry, I couldn't create your day summary due to an error: {e}"
 
-def display_daily_summary(events_data, ai_analysis, tomorrow_events_data=None):
+def display_daily_summary(events_data, ai_analysis, tomorrow_events_data=None, today=None):
     """Display the complete daily summary"""
     
-    today = datetime.now().date()
+    if today is None:
+        today = datetime.now().date()
     tomorrow = today + timedelta(days=1)
     
     print(f"\n{'='*70}")
@@ -689,35 +746,49 @@ def display_daily_summary(events_data, ai_analysis, tomorrow_events_data=None):
 def main():
     """Main function - your daily assistant"""
     
+    configure_logging()
+    
     print("🌅 Good morning! Starting your daily briefing...")
     print("=" * 60)
     
-    # Initialize TTS engine
-    print("🔊 Initializing text-to-speech...")
-    tts_engine = init_tts()
+    # Fresh order of transition words for this run
+    shuffle_transitions()
     
     # Get user's name
     user_name = get_user_name()
     
-    # Get calendar events
-    events_data = get_today_calendar_events()
+    # Get calendar events for today (and tomorrow if enabled) from a single query
+    now = datetime.now()  # Single clock reading shared by the whole run
+    today = now.date()
+    tomorrow = today + timedelta(days=1)
+    load_calendar_events(today, tomorrow + timedelta(days=1) if INCLUDE_TOMORROW else tomorrow)
+    
+    events_data = get_calendar_events(today)
     
     # Get tomorrow's events if enabled
     tomorrow_events_data = None
     if INCLUDE_TOMORROW:
-        tomorrow_events_data = get_tomorrow_calendar_events()
+        tomorrow_events_data = get_calendar_events(tomorrow)
+    
+    # Initialize TTS engine only when there are meetings to talk about
+    tts_engine = None
+    tts_skipped = not (events_data or tomorrow_events_data)  # Free day: nothing worth speaking
+    if not tts_skipped:
+        print("🔊 Initializing text-to-speech...")
+        tts_engine = init_tts()
     
     # Get day summary
-    ai_analysis = get_ai_day_analysis("", events_data, tomorrow_events_data)
+    ai_analysis = get_ai_day_analysis("", events_data, tomorrow_events_data, user_name, now,
+                                      tts_enabled=tts_engine is not None)
     
     # Display everything
-    display_daily_summary(events_data, ai_analysis, tomorrow_events_data)
+    display_daily_summary(events_data, ai_analysis, tomorrow_events_data, today)
     
     # Speak the AI analysis
     if ai_analysis and tts_engine:
         print("\n🔊 Reading your daily summary...")
         speak_text(ai_analysis, tts_engine)
-    elif ai_analysis:
+    elif ai_analysis and not tts_skipped:
         print("\n🔇 TTS not available, but here's your summary again:")
         print(ai_analysis)
 